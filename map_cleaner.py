@@ -6,29 +6,46 @@ A command-line tool to delete map files from Project Zomboid save directories.
 This script allows you to specify rectangular areas and delete corresponding map files.
 """
 
+import mmap
+import os
+import re
 import sys
 import argparse
 import struct
-from typing import List, Tuple, Set, Optional
+from typing import Dict, Iterator, List, NamedTuple, Tuple, Optional
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 
-class ChunkCoordinate:
+# Number of map coordinates along each side of a chunkdata/zpop chunk
+CHUNK_SIZE = 30
+
+# Number of per-file result lines written to stdout at once
+OUTPUT_BATCH_SIZE = 4096
+
+# Precompiled big-endian integer layouts used by BinaryReader
+_INT8 = struct.Struct('>b')
+_INT16 = struct.Struct('>h')
+_INT32 = struct.Struct('>i')
+
+# A coordinate as coordinate_to_filename writes it: ASCII digits, no sign or leading zeros
+_COORD_PATTERN = r"(0|-?[1-9][0-9]*)"
+
+# Legacy map filename: map_X_Y.bin
+_MAP_FILENAME_RE = re.compile(rf"map_{_COORD_PATTERN}_{_COORD_PATTERN}\.bin")
+
+# Modern map layout: map/X/ directories holding Y or Y.bin files
+_MAP_X_DIR_RE = re.compile(_COORD_PATTERN)
+_MAP_Y_FILE_RE = re.compile(_COORD_PATTERN + r"(?:\.bin)?")
+
+# Chunk and zpop filenames: chunkdata_X_Y.bin, zpop_X_Y.bin
+_CHUNK_FILENAME_RE = re.compile(rf"(chunkdata|zpop)_{_COORD_PATTERN}_{_COORD_PATTERN}\.bin")
+
+
+class ChunkCoordinate(NamedTuple):
     """Represents a chunk coordinate in the Project Zomboid map."""
-    def __init__(self, x: int, y: int):
-        self.x = x
-        self.y = y
-    
-    def __repr__(self):
-        return f"ChunkCoordinate({self.x}, {self.y})"
-    
-    def __eq__(self, other):
-        if not isinstance(other, ChunkCoordinate):
-            return False
-        return self.x == other.x and self.y == other.y
-    
-    def __hash__(self):
-        return hash((self.x, self.y))
+    x: int
+    y: int
 
 
 class Region:
@@ -54,6 +71,69 @@ class Region:
             self.to_x + padding,
             self.to_y + padding
         )
+    
+    def intersection(self, other: 'Region') -> Optional['Region']:
+        """Return the overlap with another region, or None if they don't overlap."""
+        from_x = max(self.from_x, other.from_x)
+        from_y = max(self.from_y, other.from_y)
+        to_x = min(self.to_x, other.to_x)
+        to_y = min(self.to_y, other.to_y)
+        if from_x >= to_x or from_y >= to_y:
+            return None
+        return Region(from_x, from_y, to_x, to_y)
+
+
+class ProtectionIndex:
+    """
+    Index of protected regions for fast point lookups.
+    
+    Regions are bucketed by row, so a lookup only scans the x-intervals that
+    cover the requested row instead of every region. Overlapping or touching
+    intervals within a row are merged, so a run of protected cells is always
+    covered by a single interval.
+    """
+    def __init__(self, regions: List[Region]):
+        rows: Dict[int, List[Tuple[int, int]]] = {}
+        for region in regions:
+            for y in range(region.from_y, region.to_y):
+                rows.setdefault(y, []).append((region.from_x, region.to_x))
+        
+        self.rows: Dict[int, List[Tuple[int, int]]] = {}
+        for y, intervals in rows.items():
+            intervals.sort()
+            merged = [intervals[0]]
+            for from_x, to_x in intervals[1:]:
+                last_from_x, last_to_x = merged[-1]
+                if from_x <= last_to_x:
+                    merged[-1] = (last_from_x, max(last_to_x, to_x))
+                else:
+                    merged.append((from_x, to_x))
+            self.rows[y] = merged
+    
+    def __repr__(self):
+        return f"ProtectionIndex({len(self.rows)} rows)"
+    
+    def contains_point(self, x: int, y: int) -> bool:
+        """Check if a point lies in any protected region."""
+        for from_x, to_x in self.rows.get(y, ()):
+            if from_x <= x < to_x:
+                return True
+        return False
+    
+    def contains_region(self, region: Region) -> bool:
+        """
+        Check if every point of a region lies in the protected regions.
+        
+        Each row is checked as a whole: since intervals are merged, the row is
+        fully protected only if one interval spans the region's x-range.
+        """
+        for y in range(region.from_y, region.to_y):
+            for from_x, to_x in self.rows.get(y, ()):
+                if from_x <= region.from_x and region.to_x <= to_x:
+                    break
+            else:
+                return False
+        return True
 
 
 class SafeHouse:
@@ -68,6 +148,15 @@ class SafeHouse:
         return f"SafeHouse({self.title}, owner={self.owner}, region={self.region})"
 
 
+class MapCoverage(NamedTuple):
+    """Summary of the map files found in a save directory."""
+    file_count: int
+    min_x: int
+    max_x: int
+    min_y: int
+    max_y: int
+
+
 class BinaryReader:
     """Helper class to read binary data from Project Zomboid files."""
     def __init__(self, data: bytes):
@@ -90,7 +179,7 @@ class BinaryReader:
     def read_int8(self) -> int:
         """Read a signed 8-bit integer."""
         try:
-            value = struct.unpack_from('>b', self.data, self.position)[0]
+            value = _INT8.unpack_from(self.data, self.position)[0]
             self.position += 1
             return value
         except struct.error as e:
@@ -99,7 +188,7 @@ class BinaryReader:
     def read_int16(self) -> int:
         """Read a signed 16-bit integer (big-endian)."""
         try:
-            value = struct.unpack_from('>h', self.data, self.position)[0]
+            value = _INT16.unpack_from(self.data, self.position)[0]
             self.position += 2
             return value
         except struct.error as e:
@@ -108,12 +197,21 @@ class BinaryReader:
     def read_int32(self) -> int:
         """Read a signed 32-bit integer (big-endian)."""
         try:
-            value = struct.unpack_from('>i', self.data, self.position)[0]
+            value = _INT32.unpack_from(self.data, self.position)[0]
             self.position += 4
             return value
         except struct.error as e:
             raise ValueError(f"Failed to read int32 at position {self.position}: {e}")
     
+    def read_int32s(self, count: int) -> Tuple[int, ...]:
+        """Read consecutive signed 32-bit integers (big-endian) in one call."""
+        try:
+            values = struct.unpack_from(f'>{count}i', self.data, self.position)
+            self.position += 4 * count
+            return values
+        except struct.error as e:
+            raise ValueError(f"Failed to read {count} int32 values at position {self.position}: {e}")
+    
     def read_string(self, length: Optional[int] = None) -> str:
         """Read a string. If length is None, read length from int16 first."""
         if length is None:
@@ -160,142 +258,204 @@ def get_coord_from_map_name(filename: str) -> ChunkCoordinate:
     Raises:
         ValueError: If filename format is invalid
     """
-    filename = filename.replace("map_", "").replace(".bin", "")
-    parts = filename.split("_")
-    if len(parts) != 2:
-        raise ValueError(f"Invalid map filename format: expected 2 coordinate parts, got {len(parts)}")
+    match = _MAP_FILENAME_RE.fullmatch(filename)
+    if not match:
+        raise ValueError(f"Invalid map filename format: {filename}")
+    return ChunkCoordinate(int(match.group(1)), int(match.group(2)))
+
+
+def _skip_map_definitions(
+    reader: BinaryReader,
+    version: int,
+    min_x: int,
+    min_y: int,
+    max_x: int,
+    max_y: int
+) -> None:
+    """
+    Skip the room and building definitions stored for every cell of the map bounds.
+    
+    This runs once per cell, which is tens of thousands of times for a full map,
+    so it tracks the position in a local variable and reads counts with
+    a precompiled struct directly instead of calling BinaryReader methods per field.
+    Room and building entries have a fixed size for a given version, so each
+    run of entries is skipped with a single position increment.
+    
+    Args:
+        reader: Reader positioned at the first cell; advanced past the last one
+        version: map_meta.bin version
+        min_x: Minimum cell X coordinate
+        min_y: Minimum cell Y coordinate
+        max_x: Maximum cell X coordinate (inclusive)
+        max_y: Maximum cell Y coordinate (inclusive)
+    
+    Raises:
+        ValueError: If the data ends before all definitions are skipped
+    """
+    # Entry sizes depend only on the version, so compute them once
+    if version < 194:
+        room_entry_size = 4
+    else:
+        room_entry_size = 8
+    if version >= 160:
+        room_entry_size += 2
+    else:
+        room_entry_size += 1
+        if version >= 34:
+            room_entry_size += 1
+    
+    building_entry_size = 1
+    if version >= 194:
+        building_entry_size += 8
+    if version >= 57:
+        building_entry_size += 4
+    if version >= 74:
+        building_entry_size += 1
+    if version >= 107:
+        building_entry_size += 1
+    if version >= 111 and version < 121:
+        building_entry_size += 4
+    if version >= 125:
+        building_entry_size += 4
+    
+    data = reader.data
+    size = len(data)
+    position = reader.position
+    unpack_int32 = _INT32.unpack_from
+    
     try:
-        return ChunkCoordinate(int(parts[0]), int(parts[1]))
-    except ValueError as e:
-        raise ValueError(f"Invalid coordinate values in filename: {e}")
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                # Skip room definitions
+                room_def_count = unpack_int32(data, position)[0]
+                position += 4
+                if room_def_count > 0:
+                    position += room_def_count * room_entry_size
+                    if position > size:
+                        raise ValueError(f"Room definitions end at position {position}, past data size {size}")
+                
+                # Skip building definitions
+                building_def_count = unpack_int32(data, position)[0]
+                position += 4
+                if building_def_count > 0:
+                    position += building_def_count * building_entry_size
+                    if position > size:
+                        raise ValueError(f"Building definitions end at position {position}, past data size {size}")
+    except struct.error as e:
+        raise ValueError(f"Failed to read int32 at position {position}: {e}")
+    
+    reader.position = position
+
+
+def _read_safehouses(data: bytes) -> List[SafeHouse]:
+    """
+    Parse safehouse data from the contents of a map_meta.bin file.
+    
+    Args:
+        data: File contents (bytes or any buffer supporting slicing, such as mmap)
+    
+    Returns:
+        List of SafeHouse objects
+    
+    Raises:
+        ValueError: If the data ends before the map definitions are complete
+    """
+    safehouses = []
+    
+    reader = BinaryReader(data)
+    reader.mark()
+    
+    # Check file type
+    file_type = reader.read_string(4)
+    
+    version = 0
+    if file_type == "META":
+        version = reader.read_int32()
+    else:
+        version = 33
+        reader.reset()
+    
+    if version < 194:
+        print(f"Warning: map_meta.bin version {version} not fully supported. Safehouse protection may not work correctly.")
+        return safehouses
+    
+    # Read map bounds
+    min_x, min_y, max_x, max_y = reader.read_int32s(4)
+    
+    # Skip room and building definitions
+    _skip_map_definitions(reader, version, min_x, min_y, max_x, max_y)
+    
+    if version <= 112:
+        # Version too old, no safehouse support
+        return safehouses
+    
+    # Try to read safehouses - may fail if file ends before safehouse section
+    try:
+        safehouse_count = reader.read_int32()
+    except (ValueError, IndexError):
+        # No safehouse data or unexpected end of file
+        return safehouses
+    
+    for i in range(safehouse_count):
+        try:
+            x, y, w, h = reader.read_int32s(4)
+            owner = reader.read_string()
+            
+            player_count = reader.read_int32()
+            players = []
+            for _ in range(player_count):
+                players.append(reader.read_string())
+            
+            reader.skip_bytes(8)  # long - last visited
+            
+            title = f"{owner}'s safe house"
+            if version >= 101:
+                title = reader.read_string()
+            
+            if version >= 177:
+                player_respawn_count = reader.read_int32()
+                for _ in range(player_respawn_count):
+                    reader.read_string()
+            
+            # Convert to map coordinates (divide by 10)
+            region = Region(
+                x // 10,
+                y // 10,
+                (x + w + 9) // 10,  # Ceiling division
+                (y + h + 9) // 10
+            )
+            
+            safehouses.append(SafeHouse(region, owner, players, title))
+        except (ValueError, IndexError) as e:
+            # Failed to read this safehouse, skip it and continue
+            # This can happen if the file format doesn't match exactly
+            break
+    
+    return safehouses
 
 
 def load_safehouses(directory_path: Path) -> List[SafeHouse]:
     """
     Load safehouse data from map_meta.bin file.
     
+    The file is memory-mapped rather than read into memory, so only the pages
+    the parser walks over are loaded.
+    
     Args:
         directory_path: Path to the save directory
     
     Returns:
         List of SafeHouse objects
     """
-    safehouses = []
     meta_file = directory_path / "map_meta.bin"
     
     if not meta_file.exists():
-        return safehouses
+        return []
     
     try:
         with open(meta_file, 'rb') as f:
-            data = f.read()
-        
-        reader = BinaryReader(data)
-        reader.mark()
-        
-        # Check file type
-        file_type = reader.read_string(4)
-        
-        version = 0
-        if file_type == "META":
-            version = reader.read_int32()
-        else:
-            version = 33
-            reader.reset()
-        
-        if version < 194:
-            print(f"Warning: map_meta.bin version {version} not fully supported. Safehouse protection may not work correctly.")
-            return safehouses
-        
-        # Read map bounds
-        min_x = reader.read_int32()
-        min_y = reader.read_int32()
-        max_x = reader.read_int32()
-        max_y = reader.read_int32()
-        
-        # Skip room and building definitions
-        for x in range(min_x, max_x + 1):
-            for y in range(min_y, max_y + 1):
-                # Skip room definitions
-                room_def_count = reader.read_int32()
-                for _ in range(room_def_count):
-                    if version < 194:
-                        reader.skip_bytes(4)
-                    else:
-                        reader.skip_bytes(8)
-                    if version >= 160:
-                        reader.skip_bytes(2)
-                    else:
-                        reader.skip_bytes(1)
-                        if version >= 34:
-                            reader.skip_bytes(1)
-                
-                # Skip building definitions
-                building_def_count = reader.read_int32()
-                for _ in range(building_def_count):
-                    if version >= 194:
-                        reader.skip_bytes(8)
-                    reader.skip_bytes(1)
-                    if version >= 57:
-                        reader.skip_bytes(4)
-                    if version >= 74:
-                        reader.skip_bytes(1)
-                    if version >= 107:
-                        reader.skip_bytes(1)
-                    if version >= 111 and version < 121:
-                        reader.skip_bytes(4)
-                    if version >= 125:
-                        reader.skip_bytes(4)
-        
-        if version <= 112:
-            # Version too old, no safehouse support
-            return safehouses
-        
-        # Try to read safehouses - may fail if file ends before safehouse section
-        try:
-            safehouse_count = reader.read_int32()
-        except (ValueError, IndexError):
-            # No safehouse data or unexpected end of file
-            return safehouses
-        
-        for i in range(safehouse_count):
-            try:
-                x = reader.read_int32()
-                y = reader.read_int32()
-                w = reader.read_int32()
-                h = reader.read_int32()
-                owner = reader.read_string()
-                
-                player_count = reader.read_int32()
-                players = []
-                for _ in range(player_count):
-                    players.append(reader.read_string())
-                
-                reader.skip_bytes(8)  # long - last visited
-                
-                title = f"{owner}'s safe house"
-                if version >= 101:
-                    title = reader.read_string()
-                
-                if version >= 177:
-                    player_respawn_count = reader.read_int32()
-                    for _ in range(player_respawn_count):
-                        reader.read_string()
-                
-                # Convert to map coordinates (divide by 10)
-                region = Region(
-                    x // 10,
-                    y // 10,
-                    (x + w + 9) // 10,  # Ceiling division
-                    (y + h + 9) // 10
-                )
-                
-                safehouses.append(SafeHouse(region, owner, players, title))
-            except (ValueError, IndexError) as e:
-                # Failed to read this safehouse, skip it and continue
-                # This can happen if the file format doesn't match exactly
-                break
-    
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _read_safehouses(data)
     except ValueError as e:
         # This is expected if the file format doesn't match exactly or there are no safehouses
         # Silently ignore and continue without safehouse protection
@@ -303,8 +463,6 @@ def load_safehouses(directory_path: Path) -> List[SafeHouse]:
     except Exception as e:
         print(f"Warning: Could not parse map_meta.bin (this is normal if no safehouses exist): {e}")
         return []
-    
-    return safehouses
 
 
 def coordinate_to_filename(x: int, y: int, filetype: str) -> str:
@@ -322,20 +480,20 @@ def coordinate_to_filename(x: int, y: int, filetype: str) -> str:
     if filetype == "M":
         return f"map_{x}_{y}.bin"
     elif filetype == "C":
-        cx = x // 30
-        cy = y // 30
+        cx = x // CHUNK_SIZE
+        cy = y // CHUNK_SIZE
         return f"chunkdata_{cx}_{cy}.bin"
     elif filetype == "Z":
-        cx = x // 30
-        cy = y // 30
+        cx = x // CHUNK_SIZE
+        cy = y // CHUNK_SIZE
         return f"zpop_{cx}_{cy}.bin"
     else:
         raise ValueError(f"Unknown filetype: {filetype}")
 
 
-def scan_directory(directory_path: Path) -> List[ChunkCoordinate]:
+def _iter_map_coordinates(directory_path: Path) -> Iterator[ChunkCoordinate]:
     """
-    Scan directory for map files and extract coordinates.
+    Yield the coordinates of map files in the directory as they are found.
     
     Supports two directory structures:
     1. Legacy: map_X_Y.bin files in the root directory
@@ -344,11 +502,9 @@ def scan_directory(directory_path: Path) -> List[ChunkCoordinate]:
     Args:
         directory_path: Path to the save directory
     
-    Returns:
-        List of ChunkCoordinate objects found in the directory
+    Yields:
+        ChunkCoordinate objects for each map file
     """
-    coords = []
-    
     if not directory_path.exists():
         raise FileNotFoundError(f"Directory not found: {directory_path}")
     
@@ -356,40 +512,96 @@ def scan_directory(directory_path: Path) -> List[ChunkCoordinate]:
         raise NotADirectoryError(f"Not a directory: {directory_path}")
     
     # Check for legacy structure: map_X_Y.bin files in root
-    for entry in directory_path.iterdir():
-        if entry.is_file() and entry.name.startswith("map_"):
-            try:
-                coord = get_coord_from_map_name(entry.name)
-                coords.append(coord)
-            except (ValueError, IndexError):
-                # Skip files that don't match the expected pattern
-                continue
+    # Filter on the name first so is_file() only runs for candidate map files
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("map_") and name.endswith(".bin") and entry.is_file():
+                try:
+                    coord = get_coord_from_map_name(name)
+                except (ValueError, IndexError):
+                    # Skip files that don't match the expected pattern
+                    continue
+                yield coord
     
     # Check for modern structure: map/X/Y files or map/X/Y.bin files
     map_dir = directory_path / "map"
-    if map_dir.exists() and map_dir.is_dir():
-        for x_dir in map_dir.iterdir():
-            if x_dir.is_dir():
-                try:
-                    x = int(x_dir.name)
-                    for y_file in x_dir.iterdir():
-                        if y_file.is_file():
-                            try:
-                                # Handle both Y and Y.bin formats
-                                filename = y_file.name
-                                if filename.endswith('.bin'):
-                                    y = int(filename[:-4])  # Remove .bin extension
-                                else:
-                                    y = int(filename)
-                                coords.append(ChunkCoordinate(x, y))
-                            except (ValueError, OSError):
-                                # Skip files with non-numeric names
-                                continue
-                except (ValueError, OSError):
+    if map_dir.is_dir():
+        with os.scandir(map_dir) as x_entries:
+            for x_entry in x_entries:
+                if not x_entry.is_dir():
+                    continue
+                x_match = _MAP_X_DIR_RE.fullmatch(x_entry.name)
+                if not x_match:
                     # Skip directories with non-numeric names
                     continue
+                x = int(x_match.group(1))
+                try:
+                    y_entries = os.scandir(x_entry.path)
+                except OSError:
+                    continue
+                with y_entries:
+                    for y_entry in y_entries:
+                        if not y_entry.is_file():
+                            continue
+                        # Handle both Y and Y.bin formats
+                        y_match = _MAP_Y_FILE_RE.fullmatch(y_entry.name)
+                        if not y_match:
+                            # Skip files with non-numeric names
+                            continue
+                        yield ChunkCoordinate(x, int(y_match.group(1)))
+
+
+def scan_directory(directory_path: Path) -> List[ChunkCoordinate]:
+    """
+    Scan directory for map files and extract coordinates.
+    
+    Supports two directory structures:
+    1. Legacy: map_X_Y.bin files in the root directory
+    2. Modern: map/X/Y or map/X/Y.bin files where X is a directory and Y is a file
+    
+    Args:
+        directory_path: Path to the save directory
+    
+    Returns:
+        List of ChunkCoordinate objects found in the directory
+    """
+    return list(_iter_map_coordinates(directory_path))
+
+
+def summarize_directory(directory_path: Path) -> Optional[MapCoverage]:
+    """
+    Count the map files in the directory and compute their bounds in one pass.
+    
+    Coordinates are consumed as the directory is scanned, without building a
+    list of all coordinates first.
+    
+    Args:
+        directory_path: Path to the save directory
     
-    return coords
+    Returns:
+        MapCoverage for the map files found, or None if there are none
+    """
+    coords = _iter_map_coordinates(directory_path)
+    first = next(coords, None)
+    if first is None:
+        return None
+    
+    file_count = 1
+    min_x = max_x = first.x
+    min_y = max_y = first.y
+    for x, y in coords:
+        file_count += 1
+        if x < min_x:
+            min_x = x
+        elif x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif y > max_y:
+            max_y = y
+    
+    return MapCoverage(file_count, min_x, max_x, min_y, max_y)
 
 
 def list_map_coverage(directory_path: Path) -> None:
@@ -399,24 +611,17 @@ def list_map_coverage(directory_path: Path) -> None:
     Args:
         directory_path: Path to the save directory
     """
-    coords = scan_directory(directory_path)
+    coverage = summarize_directory(directory_path)
     safehouses = load_safehouses(directory_path)
     
-    if not coords:
+    if coverage is None:
         print("No map files found in directory.")
         print("Make sure you're pointing to the correct save folder.")
         print("Expected structure: map_*.bin files in root OR map/X/Y or map/X/Y.bin files in subdirectories.")
     else:
-        coords.sort(key=lambda c: (c.x, c.y))
-        
-        min_x = min(c.x for c in coords)
-        max_x = max(c.x for c in coords)
-        min_y = min(c.y for c in coords)
-        max_y = max(c.y for c in coords)
-        
-        print(f"Found {len(coords)} map files")
-        print(f"Coverage area: X=[{min_x}, {max_x}], Y=[{min_y}, {max_y}]")
-        print(f"Dimensions: {max_x - min_x + 1} x {max_y - min_y + 1}")
+        print(f"Found {coverage.file_count} map files")
+        print(f"Coverage area: X=[{coverage.min_x}, {coverage.max_x}], Y=[{coverage.min_y}, {coverage.max_y}]")
+        print(f"Dimensions: {coverage.max_x - coverage.min_x + 1} x {coverage.max_y - coverage.min_y + 1}")
     
     print(f"\nFound {len(safehouses)} safehouse(s)")
     if safehouses:
@@ -428,72 +633,268 @@ def list_map_coverage(directory_path: Path) -> None:
             print(f"     Region: X=[{sh.region.from_x}, {sh.region.to_x}), Y=[{sh.region.from_y}, {sh.region.to_y})")
 
 
-def _delete_file_if_exists(
+def _get_coord_from_chunk_name(filename: str, prefix: str) -> ChunkCoordinate:
+    """
+    Extract chunk coordinates from a chunkdata or zpop filename.
+    
+    Only names in the exact form coordinate_to_filename produces are accepted,
+    so files with signs, leading zeros or non-ASCII digits are never deleted.
+    
+    Args:
+        filename: Chunk filename like "chunkdata_1_2.bin" or "zpop_1_2.bin"
+        prefix: Expected filename prefix ("chunkdata_" or "zpop_")
+    
+    Returns:
+        ChunkCoordinate object with the chunk x and y coordinates
+    
+    Raises:
+        ValueError: If filename format is invalid
+    """
+    match = _CHUNK_FILENAME_RE.fullmatch(filename)
+    if not match or match.group(1) + "_" != prefix:
+        raise ValueError(f"Invalid chunk filename format: {filename}")
+    return ChunkCoordinate(int(match.group(2)), int(match.group(3)))
+
+
+def _index_save_files(
     directory_path: Path,
-    filename: str,
-    deleted_files: Set[str],
-    dry_run: bool,
-    x: Optional[int] = None,
-    y: Optional[int] = None
-) -> bool:
+    area: Region,
+    map_data: bool = True,
+    chunk_data: bool = True,
+    zpop_data: bool = True
+) -> Tuple[List[Tuple[int, int, str]], List[Tuple[int, int, str]], List[Tuple[int, int, str]]]:
     """
-    Helper function to delete a single file.
+    Enumerate the map, chunk and zpop files in the save directory that lie in an area.
+    
+    The directory tree is read once so that deletion only visits files that
+    actually exist instead of probing the filesystem for every coordinate.
+    Files outside the area are dropped while scanning, so they are never stored
+    or sorted, and subdirectories that can only hold unrequested file types are
+    not read at all.
     
     Supports both legacy and modern directory structures:
     - Legacy: map_X_Y.bin, chunkdata_X_Y.bin, zpop_X_Y.bin in root
-    - Modern: map/X/Y or map/X/Y.bin files for map data, chunkdata/chunkdata_X_Y.bin for chunk data
+    - Modern: map/X/Y or map/X/Y.bin, chunkdata/chunkdata_X_Y.bin,
+      zpop/zpop_X_Y.bin or chunkdata/zpop_X_Y.bin
     
     Args:
-        directory_path: Path to the directory containing the file
-        filename: Name of the file to delete (used to construct the full path)
-        deleted_files: Set of already deleted filenames (to avoid duplicates)
-        dry_run: If True, only show what would be deleted without actually deleting
-        x: X coordinate (ONLY needed for map files in modern structure where the 
-           directory structure is map/X/Y instead of map_X_Y.bin)
-        y: Y coordinate (ONLY needed for map files in modern structure)
+        directory_path: Path to the save directory
+        area: Region of map coordinates to index. Chunk and zpop files are
+              included if their chunk overlaps it.
+        map_data: Whether to index map data files
+        chunk_data: Whether to index chunk data files
+        zpop_data: Whether to index zpop data files
     
     Returns:
-        True if file was deleted (or would be deleted in dry run), False otherwise
-    """
-    # Try legacy structure first: files in root
-    filepath = directory_path / filename
-    file_key = filename
-    
-    # If legacy file doesn't exist, try modern structure
-    if not filepath.exists():
-        if x is not None and y is not None and filename.startswith("map_"):
-            # Modern structure: try both map/X/Y and map/X/Y.bin
-            filepath = directory_path / "map" / str(x) / str(y)
-            if not filepath.exists():
-                filepath = directory_path / "map" / str(x) / f"{y}.bin"
-            file_key = f"map/{x}/{y}"
-        elif filename.startswith("chunkdata_"):
-            # Modern structure: chunkdata/chunkdata_X_Y.bin
-            filepath = directory_path / "chunkdata" / filename
-            file_key = f"chunkdata/{filename}"
-        elif filename.startswith("zpop_"):
-            # Modern structure: zpop files might also be in a subdirectory
-            # Try zpop subdirectory first, fall back to chunkdata
-            zpop_path = directory_path / "zpop" / filename
-            if zpop_path.exists():
-                filepath = zpop_path
-                file_key = f"zpop/{filename}"
+        Tuple of (map_files, chunk_files, zpop_files); lists for file types that
+        were not requested are empty. Each entry is an
+        (x, y, file_key) tuple where x, y are map coordinates for map files and
+        chunk coordinates for chunk/zpop files, and file_key is the path relative
+        to the save directory using forward slashes (e.g. "map/10/20.bin")
+    """
+    if not directory_path.exists():
+        raise FileNotFoundError(f"Directory not found: {directory_path}")
+    
+    if not directory_path.is_dir():
+        raise NotADirectoryError(f"Not a directory: {directory_path}")
+    
+    map_files: List[Tuple[int, int, str]] = []
+    chunk_files: List[Tuple[int, int, str]] = []
+    zpop_files: List[Tuple[int, int, str]] = []
+    
+    # Chunks overlapping the area, in chunk coordinates
+    chunk_area = Region(
+        area.from_x // CHUNK_SIZE,
+        area.from_y // CHUNK_SIZE,
+        (area.to_x - 1) // CHUNK_SIZE + 1,
+        (area.to_y - 1) // CHUNK_SIZE + 1
+    )
+    
+    def add_chunk_file(name: str, file_key: str) -> None:
+        try:
+            if chunk_data and name.startswith("chunkdata_"):
+                coord = _get_coord_from_chunk_name(name, "chunkdata_")
+                if chunk_area.contains_point(coord.x, coord.y):
+                    chunk_files.append((coord.x, coord.y, file_key))
+            elif zpop_data and name.startswith("zpop_"):
+                coord = _get_coord_from_chunk_name(name, "zpop_")
+                if chunk_area.contains_point(coord.x, coord.y):
+                    zpop_files.append((coord.x, coord.y, file_key))
+        except ValueError:
+            # Skip files that don't match the expected pattern
+            pass
+    
+    # Legacy structure: all files in root
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            if entry.name.startswith("map_") and entry.name.endswith(".bin"):
+                if not map_data:
+                    continue
+                try:
+                    coord = get_coord_from_map_name(entry.name)
+                    if area.contains_point(coord.x, coord.y):
+                        map_files.append((coord.x, coord.y, entry.name))
+                except ValueError:
+                    # Skip files like map_meta.bin
+                    continue
             else:
-                filepath = directory_path / "chunkdata" / filename
-                file_key = f"chunkdata/{filename}"
+                add_chunk_file(entry.name, entry.name)
     
-    if filepath.exists() and file_key not in deleted_files:
-        if dry_run:
-            print(f"Would delete: {file_key}")
-        else:
-            try:
-                filepath.unlink()
-                print(f"Deleted: {file_key}")
-            except Exception as e:
-                print(f"Error deleting {file_key}: {e}")
-        deleted_files.add(file_key)
-        return True
-    return False
+    # Modern structure: map/X/Y or map/X/Y.bin files
+    map_dir = directory_path / "map"
+    if map_data and map_dir.is_dir():
+        with os.scandir(map_dir) as x_entries:
+            for x_entry in x_entries:
+                if not x_entry.is_dir():
+                    continue
+                x_match = _MAP_X_DIR_RE.fullmatch(x_entry.name)
+                if not x_match:
+                    # Skip directories with non-numeric names
+                    continue
+                x = int(x_match.group(1))
+                if not area.from_x <= x < area.to_x:
+                    # Skip whole columns outside the area without listing them
+                    continue
+                key_prefix = "map/" + x_entry.name + "/"
+                with os.scandir(x_entry.path) as y_entries:
+                    for y_entry in y_entries:
+                        if not y_entry.is_file():
+                            continue
+                        name = y_entry.name
+                        y_match = _MAP_Y_FILE_RE.fullmatch(name)
+                        if not y_match:
+                            # Skip files with non-numeric names
+                            continue
+                        y = int(y_match.group(1))
+                        if area.from_y <= y < area.to_y:
+                            map_files.append((x, y, key_prefix + name))
+    
+    # Modern structure: chunkdata/ and zpop/ subdirectories
+    # zpop files may also be stored in chunkdata/
+    chunk_dir = directory_path / "chunkdata"
+    if (chunk_data or zpop_data) and chunk_dir.is_dir():
+        with os.scandir(chunk_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    add_chunk_file(entry.name, f"chunkdata/{entry.name}")
+    
+    zpop_dir = directory_path / "zpop"
+    if zpop_data and zpop_dir.is_dir():
+        with os.scandir(zpop_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.startswith("zpop_"):
+                    add_chunk_file(entry.name, f"zpop/{entry.name}")
+    
+    return map_files, chunk_files, zpop_files
+
+
+def _open_directory_fd(directory_path: Path) -> Optional[int]:
+    """
+    Open the save directory so files can be unlinked relative to it.
+    
+    Unlinking through a directory file descriptor (unlinkat) avoids resolving
+    the full save path again for every deleted file.
+    
+    Args:
+        directory_path: Path to the save directory
+    
+    Returns:
+        Directory file descriptor, or None if the platform does not support
+        dir_fd for os.unlink (e.g. Windows)
+    """
+    if os.unlink not in os.supports_dir_fd or not hasattr(os, "O_DIRECTORY"):
+        return None
+    return os.open(directory_path, os.O_RDONLY | os.O_DIRECTORY)
+
+
+def _unlink_file(dir_fd: Optional[int], dir_prefix: str, file_key: str) -> None:
+    """
+    Unlink a single file relative to the save directory.
+    
+    Args:
+        dir_fd: File descriptor of the save directory from _open_directory_fd, or
+                None to unlink by full path
+        dir_prefix: Save directory path including a trailing separator, used when
+                    dir_fd is None
+        file_key: Path of the file relative to the save directory, as produced by
+                  _index_save_files
+    
+    Raises:
+        OSError: If the file could not be deleted
+    """
+    if dir_fd is not None:
+        os.unlink(file_key, dir_fd=dir_fd)
+    else:
+        os.unlink(dir_prefix + file_key)
+
+
+def _delete_files(
+    directory_path: Path,
+    file_keys: List[str],
+    dry_run: bool,
+    quiet: bool = False
+) -> int:
+    """
+    Delete a batch of files from the save directory.
+    
+    Unlinks are issued from a thread pool so that several filesystem round-trips
+    are in flight at once. Results are reported in the order of file_keys and
+    written to stdout in batches rather than one print() per file.
+    
+    Args:
+        directory_path: Path to the save directory
+        file_keys: Paths of the files relative to directory_path, as produced by
+                   _index_save_files
+        dry_run: If True, only show what would be deleted without actually deleting
+        quiet: If True, don't list each deleted file (errors are still reported)
+    
+    Returns:
+        Number of files deleted (or that would be deleted in dry run)
+    """
+    if dry_run:
+        if quiet:
+            return len(file_keys)
+        for start in range(0, len(file_keys), OUTPUT_BATCH_SIZE):
+            batch = file_keys[start:start + OUTPUT_BATCH_SIZE]
+            sys.stdout.write("".join(f"Would delete: {file_key}\n" for file_key in batch))
+        return len(file_keys)
+    
+    if not file_keys:
+        return 0
+    
+    files_deleted = 0
+    dir_fd = _open_directory_fd(directory_path)
+    dir_prefix = os.fspath(directory_path) + os.sep
+    try:
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(file_keys))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_unlink_file, dir_fd, dir_prefix, file_key)
+                for file_key in file_keys
+            ]
+            lines: List[str] = []
+            for file_key, future in zip(file_keys, futures):
+                try:
+                    future.result()
+                    files_deleted += 1
+                    if not quiet:
+                        lines.append(f"Deleted: {file_key}\n")
+                except FileNotFoundError:
+                    # Removed by something else since the directory was scanned
+                    continue
+                except Exception as e:
+                    lines.append(f"Error deleting {file_key}: {e}\n")
+                if len(lines) >= OUTPUT_BATCH_SIZE:
+                    sys.stdout.write("".join(lines))
+                    lines.clear()
+            sys.stdout.write("".join(lines))
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    
+    return files_deleted
 
 
 def delete_files_in_area(
@@ -507,11 +908,17 @@ def delete_files_in_area(
     delete_zpop_data: bool = False,
     dry_run: bool = False,
     safehouse_protection: bool = True,
-    safehouse_padding: int = 4
+    safehouse_padding: int = 4,
+    quiet: bool = False
 ) -> Tuple[int, int, int]:
     """
     Delete map files in the specified rectangular area.
     
+    Only files that exist in the save directory are visited, so the cost is
+    proportional to the number of files rather than the size of the area.
+    Chunk and zpop files are deleted if any unprotected map coordinate of their
+    chunk lies in the area.
+    
     Args:
         directory_path: Path to the save directory
         start_x: Starting X coordinate
@@ -524,9 +931,12 @@ def delete_files_in_area(
         dry_run: If True, only show what would be deleted without actually deleting
         safehouse_protection: If True, protect safehouses from deletion
         safehouse_padding: Number of cells to protect around safehouses
+        quiet: If True, don't list each deleted file (errors are still reported)
     
     Returns:
-        Tuple of (files_checked, files_deleted, files_protected)
+        Tuple of (files_checked, files_deleted, files_protected), where
+        files_checked counts the selected files found in the area and
+        files_protected counts those skipped because of safehouse protection
     """
     if not any([delete_map_data, delete_chunk_data, delete_zpop_data]):
         print("Error: Select at least one file type to delete")
@@ -540,50 +950,69 @@ def delete_files_in_area(
         if safehouses:
             print(f"Safehouse protection enabled: protecting {len(safehouses)} safehouse(s) with {safehouse_padding} cell padding")
     
+    area = Region(start_x, start_y, end_x, end_y)
+    map_files, chunk_files, zpop_files = _index_save_files(
+        directory_path,
+        area,
+        map_data=delete_map_data,
+        chunk_data=delete_chunk_data,
+        zpop_data=delete_zpop_data
+    )
+    
+    # Every file checked below lies in the area, so only the part of each
+    # safehouse region overlapping it matters; the rest are dropped up front
+    protection = ProtectionIndex([
+        overlap for overlap in (region.intersection(area) for region in excluded_regions)
+        if overlap is not None
+    ])
+    
     files_checked = 0
-    files_deleted = 0
     files_protected = 0
-    deleted_files: Set[str] = set()
     
     print(f"{'DRY RUN: ' if dry_run else ''}Processing area: X=[{start_x}, {end_x}), Y=[{start_y}, {end_y})")
     
-    for x in range(start_x, end_x):
-        for y in range(start_y, end_y):
+    targets: List[str] = []
+    
+    # Collect map data
+    if delete_map_data:
+        # Same test as protection.contains_point, inlined since this loop
+        # runs once per map file
+        protected_rows = protection.rows
+        for x, y, file_key in sorted(map_files):
             files_checked += 1
             
-            # Check if this coordinate is in a protected safehouse region
-            is_protected = False
-            if excluded_regions:
-                for region in excluded_regions:
-                    if region.contains_point(x, y):
-                        is_protected = True
-                        break
-            
-            if is_protected:
-                files_protected += 1
-                continue
-            
-            # Delete map data
-            if delete_map_data:
-                filename = coordinate_to_filename(x, y, "M")
-                if _delete_file_if_exists(directory_path, filename, deleted_files, dry_run, x, y):
-                    files_deleted += 1
-            
-            # Delete chunk data
-            if delete_chunk_data:
-                filename = coordinate_to_filename(x, y, "C")
-                # x, y not needed - chunk files use same structure in both legacy and modern saves
-                # (chunkdata_X_Y.bin in root or chunkdata/ subdirectory)
-                if _delete_file_if_exists(directory_path, filename, deleted_files, dry_run):
-                    files_deleted += 1
-            
-            # Delete zpop data
-            if delete_zpop_data:
-                filename = coordinate_to_filename(x, y, "Z")
-                # x, y not needed - zpop files use same structure in both legacy and modern saves
-                # (zpop_X_Y.bin in root or chunkdata/ subdirectory)
-                if _delete_file_if_exists(directory_path, filename, deleted_files, dry_run):
-                    files_deleted += 1
+            for from_x, to_x in protected_rows.get(y, ()):
+                if from_x <= x < to_x:
+                    files_protected += 1
+                    break
+            else:
+                targets.append(file_key)
+    
+    # Collect chunk and zpop data
+    chunk_targets: List[Tuple[int, int, str]] = []
+    if delete_chunk_data:
+        chunk_targets.extend(sorted(chunk_files))
+    if delete_zpop_data:
+        chunk_targets.extend(sorted(zpop_files))
+    
+    for cx, cy, file_key in chunk_targets:
+        chunk_region = area.intersection(Region(
+            cx * CHUNK_SIZE,
+            cy * CHUNK_SIZE,
+            (cx + 1) * CHUNK_SIZE,
+            (cy + 1) * CHUNK_SIZE
+        ))
+        if chunk_region is None:
+            continue
+        files_checked += 1
+        
+        if protection.contains_region(chunk_region):
+            files_protected += 1
+            continue
+        
+        targets.append(file_key)
+    
+    files_deleted = _delete_files(directory_path, targets, dry_run, quiet)
     
     return files_checked, files_deleted, files_protected
 
@@ -653,6 +1082,12 @@ Examples:
         help="Show what would be deleted without actually deleting"
     )
     
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print the summary instead of listing every deleted file"
+    )
+    
     parser.add_argument(
         "--no-safehouse-protection",
         action="store_true",
@@ -710,7 +1145,8 @@ Examples:
             delete_zpop_data=args.zpop_data,
             dry_run=args.dry_run,
             safehouse_protection=not args.no_safehouse_protection,
-            safehouse_padding=args.safehouse_padding
+            safehouse_padding=args.safehouse_padding,
+            quiet=args.quiet
         )
         
         print(f"\n{'DRY RUN ' if args.dry_run else ''}Summary:")
@@ -3,21 +3,95 @@
 Test suite for the Project Zomboid Map Cleaner script.
 
 Run with: python3 test_map_cleaner.py
+To keep fixture files in memory: MAP_CLEANER_TEST_TMPDIR=/dev/shm python3 test_map_cleaner.py
 """
 
+import contextlib
+import io
+import os
+import struct
 import unittest
 import tempfile
-import shutil
 from pathlib import Path
+from typing import Iterable, List, Set, Union
 from map_cleaner import (
     ChunkCoordinate,
     get_coord_from_map_name,
     coordinate_to_filename,
     scan_directory,
+    _get_coord_from_chunk_name,
+    _iter_map_coordinates,
+    load_safehouses,
     delete_files_in_area
 )
 
 
+# Directory for fixture trees; None uses tempfile's default (honouring TMPDIR).
+# Set MAP_CLEANER_TEST_TMPDIR (e.g. to /dev/shm) to keep them on a RAM-backed filesystem
+_TEST_TEMP_DIR = os.environ.get("MAP_CLEANER_TEST_TMPDIR") or None
+
+# Precompiled layouts for building map_meta.bin fixtures
+_META_HEADER = struct.Struct('>4s5i')  # "META", version, min_x, min_y, max_x, max_y
+_INT16 = struct.Struct('>h')
+_INT32 = struct.Struct('>i')
+_SAFEHOUSE_RECT = struct.Struct('>4i')
+_INT64 = struct.Struct('>q')
+
+
+def _touch_batch(root: Union[str, Path], names: Iterable[str]):
+    """
+    Create empty files in a directory, opening the directory only once.
+    
+    Args:
+        root: Directory to create the files in
+        names: File names relative to root
+    """
+    if os.open not in os.supports_dir_fd or not hasattr(os, "O_DIRECTORY"):
+        for name in names:
+            os.close(os.open(os.path.join(root, name), os.O_CREAT | os.O_WRONLY, 0o644))
+        return
+    
+    dir_fd = os.open(root, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for name in names:
+            os.close(os.open(name, os.O_CREAT | os.O_WRONLY, 0o644, dir_fd=dir_fd))
+    finally:
+        os.close(dir_fd)
+
+
+def _list_names(directory: Path) -> Set[str]:
+    """
+    List the entry names in a directory with a single scan.
+    
+    Args:
+        directory: Directory to list
+    
+    Returns:
+        Set of names of the entries in the directory
+    """
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries}
+
+
+class _TempDirTestCase(unittest.TestCase):
+    """Base class giving each test a fresh directory under one temporary root per class."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary root directory for the whole class."""
+        cls.temp_dir = tempfile.TemporaryDirectory(dir=_TEST_TEMP_DIR)
+        cls.root_path = Path(cls.temp_dir.name)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the temporary root directory."""
+        cls.temp_dir.cleanup()
+    
+    def setUp(self):
+        """Create a fresh subdirectory of the class root for this test."""
+        self.test_path = Path(tempfile.mkdtemp(prefix=self.id().rsplit(".", 1)[-1] + "_", dir=self.root_path))
+
+
 class TestChunkCoordinate(unittest.TestCase):
     """Test ChunkCoordinate class."""
     
@@ -39,89 +113,163 @@ class TestChunkCoordinate(unittest.TestCase):
         coord_set = {coord1, coord2}
         self.assertEqual(len(coord_set), 1)
     
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(ChunkCoordinate(10, 20), "__dict__"))
+    
+    def test_tuple_unpacking(self):
+        x, y = ChunkCoordinate(10, 20)
+        self.assertEqual((x, y), (10, 20))
+        self.assertEqual(ChunkCoordinate(10, 20), (10, 20))
+    
     def test_equality_with_non_coordinate(self):
         coord = ChunkCoordinate(10, 20)
-        self.assertNotEqual(coord, "not a coordinate")
-        self.assertNotEqual(coord, 42)
-        self.assertNotEqual(coord, None)
+        for other in ["not a coordinate", 42, None]:
+            with self.subTest(other=other):
+                self.assertNotEqual(coord, other)
 
 
 class TestFilenameParsing(unittest.TestCase):
     """Test filename parsing and generation functions."""
     
     def test_get_coord_from_map_name(self):
-        coord = get_coord_from_map_name("map_12_34.bin")
-        self.assertEqual(coord.x, 12)
-        self.assertEqual(coord.y, 34)
-    
-    def test_get_coord_from_negative(self):
-        coord = get_coord_from_map_name("map_-5_-10.bin")
-        self.assertEqual(coord.x, -5)
-        self.assertEqual(coord.y, -10)
-    
-    def test_coordinate_to_filename_map(self):
-        filename = coordinate_to_filename(12, 34, "M")
-        self.assertEqual(filename, "map_12_34.bin")
-    
-    def test_coordinate_to_filename_chunk(self):
-        filename = coordinate_to_filename(30, 60, "C")
-        self.assertEqual(filename, "chunkdata_1_2.bin")
+        cases = [
+            ("map_12_34.bin", (12, 34)),
+            ("map_-5_-10.bin", (-5, -10))
+        ]
+        for filename, expected in cases:
+            with self.subTest(filename=filename):
+                coord = get_coord_from_map_name(filename)
+                self.assertEqual((coord.x, coord.y), expected)
     
-    def test_coordinate_to_filename_zpop(self):
-        filename = coordinate_to_filename(30, 60, "Z")
-        self.assertEqual(filename, "zpop_1_2.bin")
+    def test_coordinate_to_filename(self):
+        cases = [
+            (12, 34, "M", "map_12_34.bin"),
+            (30, 60, "C", "chunkdata_1_2.bin"),
+            (30, 60, "Z", "zpop_1_2.bin")
+        ]
+        for x, y, file_type, expected in cases:
+            with self.subTest(file_type=file_type):
+                self.assertEqual(coordinate_to_filename(x, y, file_type), expected)
     
     def test_coordinate_to_filename_invalid(self):
         with self.assertRaises(ValueError):
             coordinate_to_filename(10, 20, "X")
     
-    def test_get_coord_from_invalid_format(self):
-        with self.assertRaises(ValueError):
-            get_coord_from_map_name("map_12.bin")  # Missing second coordinate
+    def test_get_coord_from_invalid_name(self):
+        filenames = [
+            "map_12.bin",  # Missing second coordinate
+            "map_abc_def.bin",  # Non-numeric coordinates
+            # Names int() alone would accept must still be rejected
+            "map_1_2_3.bin",
+            "map_+1_2.bin",
+            "map_01_2.bin",  # Leading zero
+            "map__2.bin",  # Empty part
+            "map_ 1_2.bin",
+            "map_1_2.bin.bak",
+            "map_1_2.bin\n",  # Trailing newline
+            "map_\u0661_2.bin"  # Non-ASCII digit
+        ]
+        for filename in filenames:
+            with self.subTest(filename=filename):
+                with self.assertRaises(ValueError):
+                    get_coord_from_map_name(filename)
     
-    def test_get_coord_from_non_numeric(self):
-        with self.assertRaises(ValueError):
-            get_coord_from_map_name("map_abc_def.bin")  # Non-numeric coordinates
+    def test_get_coord_from_chunk_name(self):
+        cases = [
+            ("chunkdata_1_2.bin", "chunkdata_", (1, 2)),
+            ("chunkdata_0_-3.bin", "chunkdata_", (0, -3)),
+            ("zpop_10_20.bin", "zpop_", (10, 20))
+        ]
+        for filename, prefix, expected in cases:
+            with self.subTest(filename=filename):
+                coord = _get_coord_from_chunk_name(filename, prefix)
+                self.assertEqual((coord.x, coord.y), expected)
+    
+    def test_get_coord_from_invalid_chunk_name(self):
+        filenames = [
+            "chunkdata_+0_0.bin",  # Explicit sign
+            "chunkdata_0_ 0.bin",  # Whitespace
+            "chunkdata_00_0.bin",  # Leading zero
+            "chunkdata_-0_0.bin",  # Negative zero
+            "chunkdata_\u0661_0.bin",  # Non-ASCII digit
+            "chunkdata_1_2_3.bin",  # Three parts
+            "chunkdata_1_2.bin\n",  # Trailing newline
+            "zpop_1_2.bin"  # Wrong prefix
+        ]
+        for filename in filenames:
+            with self.subTest(filename=filename):
+                with self.assertRaises(ValueError):
+                    _get_coord_from_chunk_name(filename, "chunkdata_")
 
 
-class TestDirectoryScanning(unittest.TestCase):
+class TestDirectoryScanning(_TempDirTestCase):
     """Test directory scanning functionality."""
     
-    def setUp(self):
-        """Create temporary directory for testing."""
-        self.test_dir = tempfile.mkdtemp()
-        self.test_path = Path(self.test_dir)
-    
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.test_dir)
-    
     def test_scan_empty_directory(self):
         coords = scan_directory(self.test_path)
         self.assertEqual(len(coords), 0)
     
     def test_scan_with_map_files(self):
         # Create test files
-        (self.test_path / "map_10_20.bin").touch()
-        (self.test_path / "map_11_21.bin").touch()
-        (self.test_path / "chunkdata_0_0.bin").touch()  # Ignored - scan_directory only looks for map_*.bin
-        (self.test_path / "other_file.txt").touch()  # Ignored - not a map file
+        _touch_batch(self.test_path, [
+            "map_10_20.bin",
+            "map_11_21.bin",
+            "chunkdata_0_0.bin",  # Ignored - scan_directory only looks for map_*.bin
+            "other_file.txt"  # Ignored - not a map file
+        ])
         
         coords = scan_directory(self.test_path)
         self.assertEqual(len(coords), 2)
         
         # Check coordinates
-        coord_set = {(c.x, c.y) for c in coords}
-        self.assertIn((10, 20), coord_set)
-        self.assertIn((11, 21), coord_set)
+        self.assertEqual({(c.x, c.y) for c in coords}, {(10, 20), (11, 21)})
+    
+    def test_iter_map_coordinates_is_lazy(self):
+        coords = _iter_map_coordinates(self.test_path)
+        self.assertTrue(hasattr(coords, "__next__"))
+        
+        # Nothing is read until iteration starts, so files created now are seen
+        _touch_batch(self.test_path, ["map_1_2.bin"])
+        self.assertEqual(list(coords), [(1, 2)])
+    
+    def test_scan_modern_structure_skips_non_canonical_names(self):
+        map_base = os.fspath(self.test_path / "map")
+        for x in ["10", "010", "+11"]:
+            os.makedirs(f"{map_base}/{x}")
+        _touch_batch(f"{map_base}/10", ["20", "+21.bin", "022", "\u0662\u0663"])
+        _touch_batch(f"{map_base}/010", ["20"])
+        _touch_batch(f"{map_base}/+11", ["20"])
+        
+        coords = scan_directory(self.test_path)
+        self.assertEqual({(c.x, c.y) for c in coords}, {(10, 20)})
+    
+    @unittest.skipUnless(hasattr(os, "symlink"), "symlinks not supported")
+    def test_scan_follows_symlinks_like_delete(self):
+        target = self.test_path / "target.bin"
+        _touch_batch(self.test_path, ["target.bin"])
+        try:
+            os.symlink(target, self.test_path / "map_1_2.bin")
+        except OSError:
+            self.skipTest("cannot create symlinks")
+        
+        coords = scan_directory(self.test_path)
+        self.assertEqual({(c.x, c.y) for c in coords}, {(1, 2)})
+        
+        files_checked, files_deleted, files_protected = delete_files_in_area(
+            self.test_path, 0, 0, 10, 10,
+            delete_map_data=True,
+            dry_run=True,
+            quiet=True
+        )
+        self.assertEqual(files_deleted, len(coords))
     
     def test_scan_nonexistent_directory(self):
         with self.assertRaises(FileNotFoundError):
             scan_directory(Path("/nonexistent/path"))
     
     def test_scan_file_not_directory(self):
+        _touch_batch(self.test_path, ["test.txt"])
         test_file = self.test_path / "test.txt"
-        test_file.touch()
         with self.assertRaises(NotADirectoryError):
             scan_directory(test_file)
     
@@ -129,103 +277,79 @@ class TestDirectoryScanning(unittest.TestCase):
         """Test scanning files in modern map/X/Y structure."""
         # Create modern structure: map/X/Y
         map_dir = self.test_path / "map"
-        map_dir.mkdir()
         
         # Create coordinate directories and files
+        map_base = os.fspath(map_dir)
         for x in [10, 11]:
-            x_dir = map_dir / str(x)
-            x_dir.mkdir()
-            for y in [20, 21]:
-                (x_dir / str(y)).touch()
+            x_dir = f"{map_base}/{x}"
+            os.makedirs(x_dir)
+            _touch_batch(x_dir, [str(y) for y in [20, 21]])
         
         coords = scan_directory(self.test_path)
         self.assertEqual(len(coords), 4)
         
         # Check coordinates
-        coord_set = {(c.x, c.y) for c in coords}
-        self.assertIn((10, 20), coord_set)
-        self.assertIn((10, 21), coord_set)
-        self.assertIn((11, 20), coord_set)
-        self.assertIn((11, 21), coord_set)
+        self.assertEqual({(c.x, c.y) for c in coords}, {(10, 20), (10, 21), (11, 20), (11, 21)})
     
     def test_scan_mixed_structure(self):
         """Test scanning files in both legacy and modern structures."""
         # Create legacy structure
-        (self.test_path / "map_5_6.bin").touch()
+        _touch_batch(self.test_path, ["map_5_6.bin"])
         
         # Create modern structure
         map_dir = self.test_path / "map"
-        map_dir.mkdir()
         x_dir = map_dir / "10"
-        x_dir.mkdir()
-        (x_dir / "20").touch()
+        os.makedirs(x_dir)
+        _touch_batch(x_dir, ["20"])
         
         coords = scan_directory(self.test_path)
         self.assertEqual(len(coords), 2)
         
         # Check coordinates
-        coord_set = {(c.x, c.y) for c in coords}
-        self.assertIn((5, 6), coord_set)
-        self.assertIn((10, 20), coord_set)
+        self.assertEqual({(c.x, c.y) for c in coords}, {(5, 6), (10, 20)})
     
     def test_scan_modern_structure_with_bin_extension(self):
         """Test scanning files in modern map/X/Y.bin structure."""
         # Create modern structure with .bin extension: map/X/Y.bin
         map_dir = self.test_path / "map"
-        map_dir.mkdir()
         
         # Create coordinate directories and files with .bin extension
+        map_base = os.fspath(map_dir)
         for x in [10, 11]:
-            x_dir = map_dir / str(x)
-            x_dir.mkdir()
-            for y in [20, 21]:
-                (x_dir / f"{y}.bin").touch()
+            x_dir = f"{map_base}/{x}"
+            os.makedirs(x_dir)
+            _touch_batch(x_dir, [f"{y}.bin" for y in [20, 21]])
         
         coords = scan_directory(self.test_path)
         self.assertEqual(len(coords), 4)
         
         # Check coordinates
-        coord_set = {(c.x, c.y) for c in coords}
-        self.assertIn((10, 20), coord_set)
-        self.assertIn((10, 21), coord_set)
-        self.assertIn((11, 20), coord_set)
-        self.assertIn((11, 21), coord_set)
+        self.assertEqual({(c.x, c.y) for c in coords}, {(10, 20), (10, 21), (11, 20), (11, 21)})
     
     def test_scan_modern_structure_mixed_extensions(self):
         """Test scanning files with both Y and Y.bin formats."""
         # Create modern structure with mixed extensions
         map_dir = self.test_path / "map"
-        map_dir.mkdir()
         x_dir = map_dir / "10"
-        x_dir.mkdir()
-        (x_dir / "20").touch()        # Without extension
-        (x_dir / "21.bin").touch()    # With extension
+        os.makedirs(x_dir)
+        _touch_batch(x_dir, [
+            "20",        # Without extension
+            "21.bin"     # With extension
+        ])
         
         coords = scan_directory(self.test_path)
         self.assertEqual(len(coords), 2)
         
         # Check coordinates
-        coord_set = {(c.x, c.y) for c in coords}
-        self.assertIn((10, 20), coord_set)
-        self.assertIn((10, 21), coord_set)
+        self.assertEqual({(c.x, c.y) for c in coords}, {(10, 20), (10, 21)})
 
 
-class TestFileDeletion(unittest.TestCase):
+class TestFileDeletion(_TempDirTestCase):
     """Test file deletion functionality."""
     
-    def setUp(self):
-        """Create temporary directory for testing."""
-        self.test_dir = tempfile.mkdtemp()
-        self.test_path = Path(self.test_dir)
-    
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.test_dir)
-    
     def test_delete_map_files_dry_run(self):
         # Create test files
-        (self.test_path / "map_10_20.bin").touch()
-        (self.test_path / "map_10_21.bin").touch()
+        _touch_batch(self.test_path, ["map_10_20.bin", "map_10_21.bin"])
         
         files_checked, files_deleted, files_protected = delete_files_in_area(
             self.test_path, 10, 20, 11, 22,
@@ -237,14 +361,15 @@ class TestFileDeletion(unittest.TestCase):
         self.assertEqual(files_deleted, 2)
         self.assertEqual(files_protected, 0)
         # Files should still exist in dry run
-        self.assertTrue((self.test_path / "map_10_20.bin").exists())
-        self.assertTrue((self.test_path / "map_10_21.bin").exists())
+        self.assertEqual(_list_names(self.test_path), {"map_10_20.bin", "map_10_21.bin"})
     
     def test_delete_map_files(self):
         # Create test files
-        (self.test_path / "map_10_20.bin").touch()
-        (self.test_path / "map_10_21.bin").touch()
-        (self.test_path / "map_15_25.bin").touch()  # Outside area
+        _touch_batch(self.test_path, [
+            "map_10_20.bin",
+            "map_10_21.bin",
+            "map_15_25.bin"  # Outside area
+        ])
         
         files_checked, files_deleted, files_protected = delete_files_in_area(
             self.test_path, 10, 20, 11, 22,
@@ -255,11 +380,8 @@ class TestFileDeletion(unittest.TestCase):
         self.assertEqual(files_checked, 2)
         self.assertEqual(files_deleted, 2)
         self.assertEqual(files_protected, 0)
-        # Files in area should be deleted
-        self.assertFalse((self.test_path / "map_10_20.bin").exists())
-        self.assertFalse((self.test_path / "map_10_21.bin").exists())
-        # File outside area should remain
-        self.assertTrue((self.test_path / "map_15_25.bin").exists())
+        # Only the file outside the area should remain
+        self.assertEqual(_list_names(self.test_path), {"map_15_25.bin"})
     
     def test_delete_no_file_types_selected(self):
         files_checked, files_deleted, files_protected = delete_files_in_area(
@@ -275,9 +397,7 @@ class TestFileDeletion(unittest.TestCase):
     
     def test_delete_multiple_file_types(self):
         # Create test files
-        (self.test_path / "map_30_60.bin").touch()
-        (self.test_path / "chunkdata_1_2.bin").touch()
-        (self.test_path / "zpop_1_2.bin").touch()
+        _touch_batch(self.test_path, ["map_30_60.bin", "chunkdata_1_2.bin", "zpop_1_2.bin"])
         
         files_checked, files_deleted, files_protected = delete_files_in_area(
             self.test_path, 30, 60, 31, 61,
@@ -286,22 +406,18 @@ class TestFileDeletion(unittest.TestCase):
             delete_zpop_data=True
         )
         
-        self.assertEqual(files_checked, 1)
+        self.assertEqual(files_checked, 3)
         self.assertEqual(files_deleted, 3)
         self.assertEqual(files_protected, 0)
-        self.assertFalse((self.test_path / "map_30_60.bin").exists())
-        self.assertFalse((self.test_path / "chunkdata_1_2.bin").exists())
-        self.assertFalse((self.test_path / "zpop_1_2.bin").exists())
+        self.assertEqual(_list_names(self.test_path), set())
     
     def test_delete_modern_structure(self):
         """Test deletion of files in modern map/X/Y structure."""
         # Create modern structure
         map_dir = self.test_path / "map"
-        map_dir.mkdir()
         x_dir = map_dir / "10"
-        x_dir.mkdir()
-        (x_dir / "20").touch()
-        (x_dir / "21").touch()
+        os.makedirs(x_dir)
+        _touch_batch(x_dir, ["20", "21"])
         
         files_checked, files_deleted, files_protected = delete_files_in_area(
             self.test_path, 10, 20, 11, 22,
@@ -313,16 +429,14 @@ class TestFileDeletion(unittest.TestCase):
         self.assertEqual(files_deleted, 2)
         self.assertEqual(files_protected, 0)
         # Files should be deleted
-        self.assertFalse((x_dir / "20").exists())
-        self.assertFalse((x_dir / "21").exists())
+        self.assertEqual(_list_names(x_dir), set())
     
     def test_delete_modern_chunkdata(self):
         """Test deletion of chunkdata files in modern structure."""
         # Create modern chunkdata structure
         chunkdata_dir = self.test_path / "chunkdata"
         chunkdata_dir.mkdir()
-        (chunkdata_dir / "chunkdata_0_34.bin").touch()
-        (chunkdata_dir / "chunkdata_1_35.bin").touch()
+        _touch_batch(chunkdata_dir, ["chunkdata_0_34.bin", "chunkdata_1_35.bin"])
         
         # Chunk 0_34 covers map coordinates 0-29, 1020-1049 (30x30 tiles per chunk)
         files_checked, files_deleted, files_protected = delete_files_in_area(
@@ -331,23 +445,116 @@ class TestFileDeletion(unittest.TestCase):
             dry_run=False
         )
         
-        # We check 30x30 = 900 coordinates, but only 1 chunkdata file should be deleted
-        self.assertEqual(files_checked, 900)
+        # Only the chunkdata file inside the area is checked, not every coordinate
+        self.assertEqual(files_checked, 1)
         self.assertEqual(files_deleted, 1)
         self.assertEqual(files_protected, 0)
-        self.assertFalse((chunkdata_dir / "chunkdata_0_34.bin").exists())
         # Other chunk should remain
-        self.assertTrue((chunkdata_dir / "chunkdata_1_35.bin").exists())
+        self.assertEqual(_list_names(chunkdata_dir), {"chunkdata_1_35.bin"})
+    
+    def test_delete_chunkdata_partial_overlap(self):
+        """Test that chunks only partly inside the area are checked once each."""
+        chunkdata_dir = self.test_path / "chunkdata"
+        chunkdata_dir.mkdir()
+        _touch_batch(chunkdata_dir, [
+            "chunkdata_0_34.bin",
+            "chunkdata_1_34.bin",
+            "chunkdata_2_34.bin"  # Outside area
+        ])
+        
+        # Area spans the right part of chunk 0_34 and the left part of chunk 1_34
+        files_checked, files_deleted, files_protected = delete_files_in_area(
+            self.test_path, 20, 1025, 40, 1030,
+            delete_chunk_data=True,
+            dry_run=False
+        )
+        
+        self.assertEqual(files_checked, 2)
+        self.assertEqual(files_deleted, 2)
+        self.assertEqual(files_protected, 0)
+        self.assertEqual(_list_names(chunkdata_dir), {"chunkdata_2_34.bin"})
+    
+    def test_delete_skips_non_canonical_chunk_names(self):
+        chunkdata_dir = self.test_path / "chunkdata"
+        chunkdata_dir.mkdir()
+        _touch_batch(chunkdata_dir, ["chunkdata_0_0.bin", "chunkdata_+0_1.bin", "chunkdata_0_ 2.bin"])
+        
+        files_checked, files_deleted, files_protected = delete_files_in_area(
+            self.test_path, 0, 0, 100, 100,
+            delete_chunk_data=True,
+            quiet=True
+        )
+        
+        self.assertEqual(files_deleted, 1)
+        self.assertEqual(_list_names(chunkdata_dir), {"chunkdata_+0_1.bin", "chunkdata_0_ 2.bin"})
+    
+    def test_delete_skips_non_canonical_map_names(self):
+        map_dir = self.test_path / "map"
+        x_dir = map_dir / "10"
+        os.makedirs(x_dir)
+        os.makedirs(map_dir / "010")
+        _touch_batch(x_dir, ["20", "+21.bin"])
+        _touch_batch(map_dir / "010", ["20"])
+        
+        files_checked, files_deleted, files_protected = delete_files_in_area(
+            self.test_path, 0, 0, 100, 100,
+            delete_map_data=True,
+            quiet=True
+        )
+        
+        self.assertEqual(files_deleted, 1)
+        self.assertEqual(_list_names(x_dir), {"+21.bin"})
+        self.assertEqual(_list_names(map_dir / "010"), {"20"})
+    
+    def test_delete_large_area_is_chunk_bounded(self):
+        """Test that a large area costs per chunk file, not per coordinate."""
+        chunkdata_dir = self.test_path / "chunkdata"
+        chunkdata_dir.mkdir()
+        _touch_batch(chunkdata_dir, [
+            "chunkdata_0_0.bin",
+            "chunkdata_50_50.bin",
+            "chunkdata_99_99.bin",
+            "chunkdata_100_0.bin"  # Outside area
+        ])
+        
+        # 3000x3000 coordinates, 100x100 chunks
+        files_checked, files_deleted, files_protected = delete_files_in_area(
+            self.test_path, 0, 0, 3000, 3000,
+            delete_chunk_data=True,
+            dry_run=True
+        )
+        
+        self.assertEqual(files_checked, 3)
+        self.assertEqual(files_deleted, 3)
+        self.assertEqual(files_protected, 0)
+    
+    def test_delete_lists_files_unless_quiet(self):
+        for quiet in [False, True]:
+            with self.subTest(quiet=quiet):
+                _touch_batch(self.test_path, ["map_10_20.bin"])
+                
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    files_checked, files_deleted, files_protected = delete_files_in_area(
+                        self.test_path, 10, 20, 11, 21,
+                        delete_map_data=True,
+                        quiet=quiet
+                    )
+                
+                self.assertEqual(files_deleted, 1)
+                self.assertIn("Processing area", output.getvalue())
+                if quiet:
+                    self.assertNotIn("Deleted:", output.getvalue())
+                else:
+                    self.assertIn("Deleted: map_10_20.bin", output.getvalue())
     
     def test_delete_modern_structure_with_bin_extension(self):
         """Test deletion of files in modern map/X/Y.bin structure."""
         # Create modern structure with .bin extension
         map_dir = self.test_path / "map"
-        map_dir.mkdir()
         x_dir = map_dir / "10"
-        x_dir.mkdir()
-        (x_dir / "20.bin").touch()
-        (x_dir / "21.bin").touch()
+        os.makedirs(x_dir)
+        _touch_batch(x_dir, ["20.bin", "21.bin"])
         
         files_checked, files_deleted, files_protected = delete_files_in_area(
             self.test_path, 10, 20, 11, 22,
@@ -359,8 +566,102 @@ class TestFileDeletion(unittest.TestCase):
         self.assertEqual(files_deleted, 2)
         self.assertEqual(files_protected, 0)
         # Files should be deleted
-        self.assertFalse((x_dir / "20.bin").exists())
-        self.assertFalse((x_dir / "21.bin").exists())
+        self.assertEqual(_list_names(x_dir), set())
+
+
+class TestSafehouseLoading(_TempDirTestCase):
+    """Test map_meta.bin safehouse loading."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create the class root directory and the shared map_meta.bin header."""
+        super().setUpClass()
+        
+        # Version 194 header and map bounds with a single empty cell, shared by all tests
+        cls.meta_header = b"".join([
+            _META_HEADER.pack(b"META", 194, 0, 0, 0, 0),
+            _INT32.pack(0),  # Room definitions in cell (0, 0)
+            _INT32.pack(0)  # Building definitions in cell (0, 0)
+        ])
+    
+    @staticmethod
+    def _string(value: str) -> bytes:
+        encoded = value.encode("utf-8")
+        return _INT16.pack(len(encoded)) + encoded
+    
+    @classmethod
+    def _safehouse(cls, x: int, y: int, w: int, h: int, owner: str, players: List[str], title: str) -> bytes:
+        """Build the map_meta.bin record of a single safehouse."""
+        parts = [
+            _SAFEHOUSE_RECT.pack(x, y, w, h),
+            cls._string(owner),
+            _INT32.pack(len(players))
+        ]
+        parts.extend(cls._string(player) for player in players)
+        parts.append(_INT64.pack(0))  # Last visited
+        parts.append(cls._string(title))
+        parts.append(_INT32.pack(0))  # Respawn player count
+        return b"".join(parts)
+    
+    def _write_meta_file(self, *safehouses: bytes) -> None:
+        """Write map_meta.bin with the shared header and the given safehouse records."""
+        data = self.meta_header + _INT32.pack(len(safehouses)) + b"".join(safehouses)
+        (self.test_path / "map_meta.bin").write_bytes(data)
+    
+    def test_load_safehouses_missing_file(self):
+        self.assertEqual(load_safehouses(self.test_path), [])
+    
+    def test_load_safehouses_valid_file(self):
+        self._write_meta_file(self._safehouse(1000, 2000, 50, 30, "alice", ["bob"], "Base"))
+        
+        safehouses = load_safehouses(self.test_path)
+        self.assertEqual(len(safehouses), 1)
+        
+        safehouse = safehouses[0]
+        self.assertEqual(safehouse.owner, "alice")
+        self.assertEqual(safehouse.players, ["bob"])
+        self.assertEqual(safehouse.title, "Base")
+        region = safehouse.region
+        self.assertEqual(
+            (region.from_x, region.from_y, region.to_x, region.to_y),
+            (100, 200, 105, 203)
+        )
+    
+    def test_load_safehouses_multiple(self):
+        self._write_meta_file(
+            self._safehouse(1000, 2000, 50, 30, "alice", [], "First"),
+            self._safehouse(0, 0, 10, 10, "carol", ["dave", "erin"], "Second")
+        )
+        
+        safehouses = load_safehouses(self.test_path)
+        self.assertEqual([safehouse.title for safehouse in safehouses], ["First", "Second"])
+        self.assertEqual(safehouses[1].players, ["dave", "erin"])
+    
+    def test_load_safehouses_rereads_rewritten_file(self):
+        self._write_meta_file(self._safehouse(1000, 2000, 50, 30, "alice", [], "First"))
+        self.assertEqual(len(load_safehouses(self.test_path)), 1)
+        
+        self._write_meta_file(
+            self._safehouse(1000, 2000, 50, 30, "alice", [], "First"),
+            self._safehouse(0, 0, 10, 10, "carol", [], "Second")
+        )
+        self.assertEqual(len(load_safehouses(self.test_path)), 2)
+    
+    def test_delete_skips_safehouse(self):
+        self._write_meta_file(self._safehouse(1000, 2000, 50, 30, "alice", ["bob"], "Base"))
+        _touch_batch(self.test_path, ["map_100_200.bin", "map_110_200.bin"])
+        
+        files_checked, files_deleted, files_protected = delete_files_in_area(
+            self.test_path, 100, 200, 111, 201,
+            delete_map_data=True,
+            safehouse_padding=0,
+            quiet=True
+        )
+        
+        self.assertEqual(files_checked, 2)
+        self.assertEqual(files_deleted, 1)
+        self.assertEqual(files_protected, 1)
+        self.assertEqual(_list_names(self.test_path), {"map_meta.bin", "map_100_200.bin"})
 
 
 if __name__ == "__main__":